@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, field
 from typing import Dict, List, Set
 
+_ENV_VARS = ('COPRA_STUB_DIR', 'COPRA_STUB_FILENAME', 'COPRA_MAX_DEPTH')
+
+def _read_env() -> tuple[str | None, ...]:
+    """Read the copra environment variables in ``_ENV_VARS`` order."""
+    return tuple(os.getenv(name) for name in _ENV_VARS)
+
 @dataclass
 class TypePatterns:
     """Patterns for type detection through cocotb handles only."""
@@ -93,15 +100,21 @@ class CopraConfig:
     @classmethod
     def from_env(cls) -> 'CopraConfig':
         """Load configuration from environment variables."""
+        return cls._from_env_values(_read_env())
+    
+    @classmethod
+    def _from_env_values(cls, env_values: tuple[str | None, ...]) -> CopraConfig:
+        """Build configuration from values read in ``_ENV_VARS`` order."""
         config = cls()
+        stub_dir, stub_filename, max_depth = env_values
         
-        if stub_dir := os.getenv('COPRA_STUB_DIR'):
+        if stub_dir:
             config.output.default_stub_dir = stub_dir
         
-        if stub_filename := os.getenv('COPRA_STUB_FILENAME'):
+        if stub_filename:
             config.output.stub_filename = stub_filename
         
-        if max_depth := os.getenv('COPRA_MAX_DEPTH'):
+        if max_depth:
             try:
                 config.discovery.max_depth = int(max_depth)
             except ValueError:
@@ -109,6 +122,15 @@ class CopraConfig:
                 
         return config
 
+@functools.lru_cache(maxsize=8)
+def _load_config(env_values: tuple[str | None, ...]) -> CopraConfig:
+    """Build the configuration once per distinct set of copra environment variables."""
+    return CopraConfig._from_env_values(env_values)
+
 def get_config() -> CopraConfig:
-    """Get the global configuration instance."""
-    return CopraConfig.from_env() 
+    """Get the global configuration instance.
+
+    Callers with the same copra environment variables share one instance, so treat it as
+    read-only.
+    """
+    return _load_config(_read_env())
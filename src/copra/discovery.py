@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, FrozenSet, Set
 
 from cocotb.handle import (
     HierarchyArrayObject,
@@ -12,8 +12,18 @@ from cocotb import simulator
 from .introspection import extract_full_type_info
 from .config import get_config
 
+def _resolve_scope_types(scope_types: Set[str]) -> FrozenSet[int]:
+    """Resolve configured scope type names to simulator type constants."""
+    return frozenset(
+        getattr(simulator, scope_type)
+        for scope_type in scope_types
+        if hasattr(simulator, scope_type)
+    )
+
 @dataclass
 class HDLNode:
+    __slots__ = ('path', 'py_type', 'width', 'is_scope')
+    
     path: str
     py_type: str
     width: int | None
@@ -26,7 +36,9 @@ class HierarchyDict(Dict[str, Any]):
         super().__init__()
         self._nodes: Dict[str, HDLNode] = {}
         self._tree: Dict[str, Any] = {}
+        self._tree_entries: Dict[str, Dict[str, Any]] = {}
         self.config = get_config()
+        self._scope_types = _resolve_scope_types(self.config.discovery.scope_types)
     
     def add_node(self, obj: SimHandleBase, path: str) -> None:
         """Add a node to the hierarchy, building the tree structure as we go."""
@@ -58,29 +70,24 @@ class HierarchyDict(Dict[str, Any]):
             if handle is None:
                 return isinstance(obj, (HierarchyObject, HierarchyArrayObject))
                 
-            sim_type = handle.get_type()
-            scope_type_constants = {
-                getattr(simulator, scope_type) 
-                for scope_type in self.config.discovery.scope_types
-                if hasattr(simulator, scope_type)
-            }
-            return sim_type in scope_type_constants
+            return handle.get_type() in self._scope_types
         except (AttributeError, TypeError, RuntimeError):
             return isinstance(obj, (HierarchyObject, HierarchyArrayObject))
     
     def _build_tree_node(self, node: HDLNode) -> None:
         """Build tree structure for a single node as it's discovered."""
-        path_parts = node.path.split(".")
-        current = self._tree
-        
-        for i, part in enumerate(path_parts):
-            if part not in current:
-                current[part] = {"_node": None, "_children": {}}
-            
-            if i == len(path_parts) - 1:
-                current[part]["_node"] = node
-            
-            current = current[part]["_children"]
+        self._get_tree_entry(node.path)["_node"] = node
+    
+    def _get_tree_entry(self, path: str) -> Dict[str, Any]:
+        """Get the tree entry for a path, creating it and any missing parents."""
+        entry = self._tree_entries.get(path)
+        if entry is None:
+            # Parents are usually discovered first, so this resolves in one cached lookup
+            parent_path, sep, name = path.rpartition(".")
+            siblings = self._get_tree_entry(parent_path)["_children"] if sep else self._tree
+            entry = siblings.setdefault(name, {"_node": None, "_children": {}})
+            self._tree_entries[path] = entry
+        return entry
     
     def get_nodes(self) -> list[HDLNode]:
         """Get all nodes as a list."""
@@ -95,6 +102,7 @@ class HierarchyDiscoverer:
     
     def __init__(self):
         self.config = get_config()
+        self._scope_types = _resolve_scope_types(self.config.discovery.scope_types)
     
     async def discover(self, dut: SimHandleBase) -> HierarchyDict:
         """Discover hierarchy iteratively while building, avoiding explore-then-rebuild pattern."""
@@ -126,8 +134,13 @@ class HierarchyDiscoverer:
         
         sub_handles = getattr(obj, "_sub_handles", {})
         
+        # Array elements are named like "gen[0]" and live beside the array,
+        # so they recurse with the array's own prefix.
+        is_array = isinstance(obj, HierarchyArrayObject)
+        child_prefix = path_prefix if is_array else full_path
+        
         for key, child in sub_handles.items():
-            if isinstance(obj, HierarchyArrayObject):
+            if is_array:
                 child_path = f"{full_path}[{key}]"
             else:
                 child_path = f"{full_path}.{key}"
@@ -138,7 +151,7 @@ class HierarchyDiscoverer:
                 await self._discover_recursive(
                     child, 
                     hierarchy, 
-                    child_path.rsplit('.', 1)[0] if '.' in child_path else "",
+                    child_prefix,
                     current_depth + 1
                 )
     
@@ -146,16 +159,10 @@ class HierarchyDiscoverer:
         """Determine if we should recurse into a child object."""
         try:
             child_handle = getattr(child, "_handle", None)
-            if not child_handle:
+            if child_handle is None:
                 return False
             
-            child_sim_type = child_handle.get_type()
-            scope_type_constants = {
-                getattr(simulator, scope_type) 
-                for scope_type in self.config.discovery.scope_types
-                if hasattr(simulator, scope_type)
-            }
-            return child_sim_type in scope_type_constants
+            return child_handle.get_type() in self._scope_types
         except (AttributeError, TypeError, RuntimeError):
             return False
 
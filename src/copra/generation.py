@@ -13,6 +13,8 @@ class StubGenerator:
     
     def __init__(self):
         self.config = get_config()
+        self._hierarchy_array_base = self.config.types.base_classes['hierarchy_array']
+        self._hierarchy_array_class = self._hierarchy_array_base.split('.')[-1]
     
     def generate_stub(self, hierarchy: HierarchyDict, out_dir: Path) -> Path:
         """Generate comprehensive stub file from HierarchyDict with proper cocotb types."""
@@ -41,7 +43,7 @@ class StubGenerator:
             top_class_name = sanitize_name(top_key)
             
             base_class_key = 'hierarchy'
-            if top_node and self.config.types.base_classes['hierarchy_array'].split('.')[-1] in top_node.py_type:
+            if top_node and self._hierarchy_array_class in top_node.py_type:
                 base_class_key = 'hierarchy_array'
             
             base_class = self.config.types.base_classes[base_class_key]
@@ -90,13 +92,12 @@ class StubGenerator:
                 if can_be_attribute:
                     if child_node.is_scope:
                         class_name = sanitize_name(child_name)
-                        hierarchy_array_class = self.config.types.base_classes['hierarchy_array'].split('.')[-1]
                         
-                        if hierarchy_array_class in child_node.py_type:
+                        if self._hierarchy_array_class in child_node.py_type:
                             if "[" in child_node.py_type and "]" in child_node.py_type:
                                 type_annotation = child_node.py_type
                             else:
-                                type_annotation = f"{self.config.types.base_classes['hierarchy_array']}[{class_name}]"
+                                type_annotation = f"{self._hierarchy_array_base}[{class_name}]"
                         else:
                             type_annotation = class_name
                     else:
@@ -120,14 +121,13 @@ class StubGenerator:
                 
                 if child_node.is_scope:
                     class_name = sanitize_name(child_name)
-                    base = self.config.types.base_classes['hierarchy_array']
                     # if its already parameterized no need to add the class name
-                    if base.split('.')[-1] in child_node.py_type:
+                    if self._hierarchy_array_class in child_node.py_type:
                         type_annotation = (
                             child_node.py_type if 
                             "[" in child_node.py_type and 
                             "]" in child_node.py_type else 
-                            f"{base}[{class_name}]"
+                            f"{self._hierarchy_array_base}[{class_name}]"
                         )
                     else:
                         type_annotation = class_name
@@ -189,7 +189,7 @@ class StubGenerator:
                     generated_classes.add(class_name)
                     
                     base_class_key = 'hierarchy'
-                    hierarchy_array_class = self.config.types.base_classes['hierarchy_array'].split('.')[-1]
+                    hierarchy_array_class = self._hierarchy_array_class
                     if hierarchy_array_class in node.py_type:
                         base_class_key = 'hierarchy_array'
                     
@@ -220,7 +220,7 @@ class StubGenerator:
                                     if "[" in child_node.py_type and "]" in child_node.py_type:
                                         type_annotation = child_node.py_type
                                     else:
-                                        type_annotation = f"{self.config.types.base_classes['hierarchy_array']}[{child_class_name}]"
+                                        type_annotation = f"{self._hierarchy_array_base}[{child_class_name}]"
                                     lines.append(indent(f"{child_name}: {type_annotation}", "    "))
                                 else:
                                     lines.append(indent(f"{child_name}: {child_class_name}", "    "))
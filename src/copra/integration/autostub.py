@@ -1,3 +1,4 @@
+import logging
 import os
 from pathlib import Path
 from cocotb.handle import HierarchyObject
@@ -6,12 +7,14 @@ from copra.discovery import discover
 from copra.generation import generate_stub
 from copra.config import get_config
 
+logger = logging.getLogger("cocotb.copra")
+
 @cocotb.test()
 async def copra_autostub(dut: HierarchyObject) -> None:
     """Auto-generate stubs for the DUT hierarchy."""
     config = get_config()
     
-    print("[copra] Discovering HDL hierarchy…")
+    logger.info("Discovering HDL hierarchy…")
     h = await discover(dut)
     
     out_dir_path = os.getenv(config.output.env_var_stub_dir, config.output.default_stub_dir)
@@ -20,6 +23,5 @@ async def copra_autostub(dut: HierarchyObject) -> None:
     if not out_dir.is_absolute():
         out_dir = Path.cwd() / out_dir
     
-    out_dir.mkdir(parents=True, exist_ok=True)
     stub = generate_stub(h, out_dir)
-    print(f"[copra] Stub written → {stub}")
+    logger.info("Stub written → %s", stub)
@@ -13,11 +13,12 @@ from copra.config import get_config
 
 def main():
     config = get_config()
+    env = os.environ.copy()
     
     if len(sys.argv) > 1:
         output_dir = Path(sys.argv[1])
     else:
-        out_dir_path = os.getenv(config.output.env_var_stub_dir, config.output.default_stub_dir)
+        out_dir_path = env.get(config.output.env_var_stub_dir, config.output.default_stub_dir)
         output_dir = Path(out_dir_path)
     
     if not output_dir.is_absolute():
@@ -25,27 +26,29 @@ def main():
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    sim = os.getenv("SIM", "icarus")
-    hdl_toplevel = os.getenv("COCOTB_TOPLEVEL")
-    hdl_toplevel_lang = os.getenv("TOPLEVEL_LANG", "verilog")
+    sim = env.get("SIM", "icarus")
+    hdl_toplevel = env.get("COCOTB_TOPLEVEL")
+    hdl_toplevel_lang = env.get("TOPLEVEL_LANG", "verilog")
     
     if not hdl_toplevel:
         sys.exit(1)
     
-    verilog_sources, vhdl_sources = os.getenv("VERILOG_SOURCES", ""), os.getenv("VHDL_SOURCES", "")
+    verilog_sources, vhdl_sources = env.get("VERILOG_SOURCES", ""), env.get("VHDL_SOURCES", "")
     
     if hdl_toplevel_lang == "verilog" and verilog_sources:
-        sources = [Path(s.strip()) for s in verilog_sources.split() if s.strip()]
+        source_list = verilog_sources
     elif hdl_toplevel_lang == "vhdl" and vhdl_sources:
-        sources = [Path(s.strip()) for s in vhdl_sources.split() if s.strip()]
+        source_list = vhdl_sources
     else:
         sys.exit(1)
     
+    # str.split() without arguments already drops surrounding and empty whitespace entries
+    sources = [Path(s) for s in source_list.split()]
+    
     build_args: list[str] = []
     
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
-        env = os.environ.copy()
         env["COPRA_STUB_DIR"] = str(output_dir)
         runner = get_runner(sim)
         
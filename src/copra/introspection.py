@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, Optional, Tuple, Any
+import functools
+from typing import Any, Callable, Dict, Final, Iterable, List, Optional, Tuple
 from cocotb.handle import (
     SimHandleBase, ArrayObject, HierarchyArrayObject,
     LogicObject, LogicArrayObject, IntegerObject, RealObject, 
@@ -9,19 +10,66 @@ from cocotb.handle import (
 from cocotb import simulator
 from .config import get_config
 
+_ARRAY_VALUE_OPEN: Final = "cocotb.types.Array["
+_LOGIC_ARRAY_OBJECT: Final = "cocotb.handle.LogicArrayObject"
+_SIMHANDLE_HIERARCHY_ARRAY: Final = "cocotb.handle.HierarchyArrayObject[cocotb.handle.SimHandleBase]"
+
+@functools.lru_cache(maxsize=4096)
+def _camelcase(name: str) -> str:
+    """Convert a snake_case HDL identifier to CamelCase."""
+    return ''.join(word.capitalize() for word in name.split('_'))
+
 def sanitize_name(name: str) -> str:
     """Convert HDL name to Python class name - shared with generation module."""
-    return ''.join(word.capitalize() for word in name.split('[')[0].split('_'))
+    return _camelcase(name.split('[')[0])
 
 class TypeIntrospector:
     """Clean type introspection using only cocotb's type hierarchy."""
     
+    __slots__ = (
+        'config',
+        '_type_mappings',
+        '_value_mappings',
+        '_simulator_type_handlers',
+        '_netarray_type',
+        '_base_class_mappings',
+        '_type_name_strings',
+        '_fixed_type_strings',
+        '_special_types',
+        '_netarray_type_cache',
+        '_fallback_base',
+        '_fallback_value',
+        '_fallback_handle',
+        '_fallback_genarray',
+        '_fallback_genarray_simhandle',
+        '_generate_prefixes',
+    )
+    
     def __init__(self):
         self.config = get_config()
+        self._fallback_base = self.config.types.fallback_types['base']
+        self._fallback_value = self.config.types.fallback_types['value']
+        self._fallback_handle = self.config.types.fallback_types['handle']
         self._type_mappings = self._build_type_mappings()
         self._value_mappings = self._build_value_mappings()
         self._simulator_type_handlers = self._build_simulator_type_handlers()
+        self._netarray_type = getattr(simulator, 'NETARRAY', None)
         self._base_class_mappings = self._build_base_class_mappings()
+        self._type_name_strings = self._build_type_name_strings()
+        self._netarray_type_cache: Dict[Tuple[Optional[int], int], str] = {}
+        self._special_types = frozenset(
+            sim_type for sim_type in (self._netarray_type, getattr(simulator, 'GENARRAY', None))
+            if sim_type in self._type_mappings
+        )
+        # Simulator types whose type string never depends on the object itself
+        self._fixed_type_strings = {
+            sim_type: type_string
+            for sim_type, type_string in self._type_name_strings.items()
+            if sim_type not in self._special_types
+        }
+        self._fallback_genarray = f"cocotb.handle.HierarchyArrayObject[{self._fallback_value}]"
+        self._fallback_genarray_simhandle = _SIMHANDLE_HIERARCHY_ARRAY
+        self._generate_prefixes = tuple(self.config.discovery.generate_prefixes)
     
     def _build_type_mappings(self) -> Dict[int, type]:
         """Build simulator type to cocotb handle class mappings."""
@@ -44,36 +92,38 @@ class TypeIntrospector:
                 simulator.PACKAGE: HierarchyObject,
             }
     
-    def _build_value_mappings(self) -> Dict[str, str]:
-        """Build value type to handle type mappings."""
+    def _build_value_mappings(self) -> Dict[int, Tuple[str, str]]:
+        """Build simulator type to (value type, handle type) mappings for array elements."""
         types = self.config.types
-        return {
-            types.value_types['logic']: types.base_classes['logic'],
-            types.value_types['logic_array']: types.base_classes['logic_array'], 
-            types.value_types['integer']: types.base_classes['integer'],
-            types.value_types['real']: types.base_classes['real'],
-            types.value_types['string']: types.base_classes['string'],
-            types.value_types['enum']: types.base_classes['enum'],
-        }
+        mappings = {}
+        type_keys = [
+            ('LOGIC', 'logic'),
+            ('LOGIC_ARRAY', 'logic_array'),
+            ('INTEGER', 'integer'),
+            ('REAL', 'real'),
+            ('STRING', 'string'),
+            ('ENUM', 'enum'),
+        ]
+        
+        for attr_name, key in type_keys:
+            sim_type = getattr(simulator, attr_name, None)
+            if sim_type is not None:
+                mappings[sim_type] = (types.value_types[key], types.base_classes[key])
+        
+        return mappings
     
-    def _build_simulator_type_handlers(self) -> Dict[int, str]:
+    def _build_simulator_type_handlers(self) -> Dict[int, Callable[[SimHandleBase], str]]:
         """Build mapping from simulator types to their handler methods."""
-        handlers = {}
+        handlers: Dict[int, Callable[[SimHandleBase], str]] = {}
         type_mappings = [
-            ('NETARRAY', 'NETARRAY'),
-            ('LOGIC_ARRAY', 'LOGIC_ARRAY'), 
-            ('LOGIC', 'LOGIC'),
-            ('INTEGER', 'INTEGER'),
-            ('REAL', 'REAL'),
-            ('STRING', 'STRING'),
-            ('ENUM', 'ENUM'),
-            ('GENARRAY', 'GENARRAY'),
+            ('NETARRAY', self._process_netarray_type),
+            ('GENARRAY', self._process_genarray_type),
         ]
         
-        for attr_name, handler_name in type_mappings:
+        for attr_name, handler in type_mappings:
             sim_type = getattr(simulator, attr_name, None)
             if sim_type is not None:
-                handlers[sim_type] = handler_name
+                handlers[sim_type] = handler
         
         return handlers
     
@@ -81,20 +131,27 @@ class TypeIntrospector:
         """Build mapping from base classes to their string representations."""
         return {
             HierarchyObject: "cocotb.handle.HierarchyObject",
-            ArrayObject: f"cocotb.handle.ArrayObject[{self.config.types.fallback_types['value']}, {self.config.types.fallback_types['handle']}]",
-            LogicArrayObject: "cocotb.handle.LogicArrayObject",
+            ArrayObject: f"cocotb.handle.ArrayObject[{self._fallback_value}, {self._fallback_handle}]",
+            LogicArrayObject: _LOGIC_ARRAY_OBJECT,
             LogicObject: "cocotb.handle.LogicObject",
             IntegerObject: "cocotb.handle.IntegerObject",
             RealObject: "cocotb.handle.RealObject",
             EnumObject: "cocotb.handle.EnumObject",
             StringObject: "cocotb.handle.StringObject",
-            HierarchyArrayObject: f"cocotb.handle.HierarchyArrayObject[cocotb.handle.SimHandleBase]",
+            HierarchyArrayObject: _SIMHANDLE_HIERARCHY_ARRAY,
+        }
+    
+    def _build_type_name_strings(self) -> Dict[int, str]:
+        """Build simulator type to formatted handle type string mappings."""
+        return {
+            sim_type: self._base_class_mappings.get(base_class, self._fallback_base)
+            for sim_type, base_class in self._type_mappings.items()
         }
     
     def _get_object_info(self, obj: SimHandleBase) -> Tuple[Optional[Any], int]:
         """Extract basic object information needed for type detection."""
         handle = getattr(obj, "_handle", None)
-        if not handle:
+        if handle is None:
             return None, -1
             
         sim_type = handle.get_type()
@@ -102,118 +159,103 @@ class TypeIntrospector:
     
     def _get_array_child_info(self, obj: SimHandleBase) -> Tuple[Optional[Any], Optional[int]]:
         """Get information about array child elements."""
+        if not hasattr(obj, "__getitem__"):
+            return None, None
+        
+        # Simulators raise RuntimeError rather than AttributeError for handles without a range
+        try:
+            first_idx = obj.range.left  # type: ignore
+        except (RuntimeError, AttributeError):
+            return None, None
+        
         try:
-            try:
-                range_obj = obj.range  # type: ignore
-                first_idx = range_obj.left  # type: ignore
-            except (RuntimeError, AttributeError):
-                return None, None
-                
-            if not hasattr(obj, "__getitem__"):
-                return None, None
-                
             child_obj = obj[first_idx]  # type: ignore
-            child_handle = getattr(child_obj, "_handle", None)  # type: ignore
-            if child_handle:
-                child_sim_type = child_handle.get_type()
-                return child_obj, child_sim_type    # type: ignore
-                
+            child_handle = child_obj._handle  # type: ignore
+            if child_handle is not None:
+                return child_obj, child_handle.get_type()  # type: ignore
         except (IndexError, AttributeError, TypeError):
             pass
         return None, None
     
     def _get_child_type_by_simulator_type(self, child_sim_type: int) -> Optional[str]:
         """Get child type based on simulator type using intelligent lookup."""
-        type_handler = self._simulator_type_handlers.get(child_sim_type)
-        if type_handler == 'NETARRAY':
-            return None  # Indicates recursive processing needed
-        elif type_handler == 'LOGIC_ARRAY':
-            return self.config.types.value_types['logic_array']
-        elif type_handler == 'LOGIC':
-            return self.config.types.value_types['logic']
-        elif type_handler == 'INTEGER':
-            return self.config.types.value_types['integer']
-        elif type_handler == 'REAL':
-            return self.config.types.value_types['real']
-        elif type_handler == 'STRING':
-            return self.config.types.value_types['string']
-        elif type_handler == 'ENUM':
-            return self.config.types.value_types['enum']
-        return None
+        element_types = self._value_mappings.get(child_sim_type)
+        if element_types is None:
+            return None
+        return element_types[0]
+    
+    def _walk_array(self, obj: SimHandleBase) -> Tuple[Optional[int], int]:
+        """Get the innermost element simulator type and the nesting depth of an array."""
+        depth = 0
+        while True:
+            child_obj, child_sim_type = self._get_array_child_info(obj)
+            if child_obj is None or child_sim_type is None:
+                return None, depth
+            
+            depth += 1
+            if child_sim_type != self._netarray_type:
+                return child_sim_type, depth
+            obj = child_obj
     
     def get_nested_array_child_type(self, obj: SimHandleBase) -> Optional[str]:
         """Get the child type for nested array structures."""
-        child_obj, child_sim_type = self._get_array_child_info(obj)
-        if child_obj is None or child_sim_type is None:
+        leaf_sim_type, _ = self._walk_array(obj)
+        if leaf_sim_type is None:
             return None
-            
-        child_type = self._get_child_type_by_simulator_type(child_sim_type)
-        if child_type is None and self._simulator_type_handlers.get(child_sim_type) == 'NETARRAY':
-            return self.get_nested_array_child_type(child_obj)  # type: ignore
         
-        return child_type
+        return self._get_child_type_by_simulator_type(leaf_sim_type)
     
     def get_array_depth(self, obj: SimHandleBase) -> int:
         """Get the depth of nested arrays."""
-        child_obj, child_sim_type = self._get_array_child_info(obj)
-        if child_obj is None or child_sim_type is None:
-            return 0
-            
-        if self._simulator_type_handlers.get(child_sim_type) == 'NETARRAY':
-            return 1 + self.get_array_depth(child_obj)  # type: ignore
-        else:
-            return 1
+        return self._walk_array(obj)[1]
     
     def get_array_element_value_type(self, obj: SimHandleBase) -> str:
         """Get the value type for array elements (ElemValueT)."""
-        base_type = self.get_nested_array_child_type(obj)
-        array_depth = self.get_array_depth(obj)
-        
-        if base_type and array_depth > 1:
-            result = base_type
-            for _ in range(array_depth - 1):
-                result = f"cocotb.types.Array[{result}]"
-            return result
-        elif base_type:
-            return base_type
-        return self.config.types.fallback_types['value']
+        return self._format_element_value_type(*self._walk_array(obj))
     
     def get_array_element_handle_type(self, obj: SimHandleBase) -> str:
         """Get the handle type for array elements (ChildObjectT)."""
-        base_type = self.get_nested_array_child_type(obj)
-        array_depth = self.get_array_depth(obj)
+        return self._format_element_handle_type(*self._walk_array(obj))
+    
+    def _format_element_value_type(self, leaf_sim_type: Optional[int], array_depth: int) -> str:
+        """Format the element value type for an array of the given leaf type and depth."""
+        element_types = self._value_mappings.get(leaf_sim_type) if leaf_sim_type is not None else None
+        if element_types is None:
+            return self._fallback_value
         
-        if base_type and array_depth > 1:
-            handle_base_type = self._value_mappings.get(base_type, self.config.types.fallback_types['handle'])
-            
-            result = handle_base_type
-            inner_value_type = base_type
-            
-            for _ in range(array_depth - 1):
-                result = f"cocotb.handle.ArrayObject[{inner_value_type}, {result}]"
-                inner_value_type = f"cocotb.types.Array[{inner_value_type}]"
-            
-            return result
-        elif base_type:
-            return self._value_mappings.get(base_type, self.config.types.fallback_types['handle'])
-        return self.config.types.fallback_types['handle']
+        nesting = array_depth - 1
+        return _ARRAY_VALUE_OPEN * nesting + element_types[0] + "]" * nesting
     
-    def _process_netarray_type(self, obj: SimHandleBase) -> str:
-        """Process NETARRAY type objects."""
-        elem_value_type = self.get_array_element_value_type(obj)
-        child_object_type = self.get_array_element_handle_type(obj)
+    def _format_element_handle_type(self, leaf_sim_type: Optional[int], array_depth: int) -> str:
+        """Format the element handle type for an array of the given leaf type and depth."""
+        element_types = self._value_mappings.get(leaf_sim_type) if leaf_sim_type is not None else None
+        if element_types is None:
+            return self._fallback_handle
         
-        if elem_value_type and child_object_type:
-            return f"cocotb.handle.ArrayObject[{elem_value_type}, {child_object_type}]"
-        elif elem_value_type:
-            return f"cocotb.handle.ArrayObject[{elem_value_type}, {self.config.types.fallback_types['handle']}]"
-        else:
-            return f"cocotb.handle.ArrayObject[{self.config.types.fallback_types['value']}, {self.config.types.fallback_types['handle']}]"
+        base_type, handle_base_type = element_types
+        
+        if array_depth > 1:
+            # Build the nested ArrayObject wrappers as prefix/suffix parts and join once,
+            # instead of re-formatting the whole string at every nesting level.
+            parts_prefix: List[str] = []
+            for level in reversed(range(array_depth - 1)):
+                inner_value_type = _ARRAY_VALUE_OPEN * level + base_type + "]" * level
+                parts_prefix.append(f"cocotb.handle.ArrayObject[{inner_value_type}, ")
+
+            return "".join(parts_prefix) + handle_base_type + "]" * (array_depth - 1)
+        return handle_base_type
     
-    def _process_logic_array_type(self, obj: SimHandleBase) -> str:
-        """Process LOGIC_ARRAY type objects."""
-        # LogicArrayObjects are LogicArrayObjects regardless of their length
-        return "cocotb.handle.LogicArrayObject"
+    def _process_netarray_type(self, obj: SimHandleBase) -> str:
+        """Process NETARRAY type objects."""
+        # Arrays with the same leaf type and nesting depth share one type string
+        shape = self._walk_array(obj)
+        type_string = self._netarray_type_cache.get(shape)
+        if type_string is None:
+            elem_value_type = self._format_element_value_type(*shape)
+            child_object_type = self._format_element_handle_type(*shape)
+            type_string = f"cocotb.handle.ArrayObject[{elem_value_type}, {child_object_type}]"
+            self._netarray_type_cache[shape] = type_string
+        return type_string
     
     def _process_genarray_type(self, obj: SimHandleBase) -> str:
         """Process GENARRAY type objects."""
@@ -225,72 +267,80 @@ class TypeIntrospector:
                 first_idx = 0
                 
             if not hasattr(obj, "__getitem__"):
-                return f"cocotb.handle.HierarchyArrayObject[{self.config.types.fallback_types['value']}]"
+                return self._fallback_genarray
                 
             child_obj = obj[first_idx]  # type: ignore
             
-            parent_name = getattr(obj, "_name", "")
+            # Every cocotb handle defines both _name and _path
+            try:
+                parent_name = obj._name or ""
+                parent_path = obj._path or ""
+            except AttributeError:
+                parent_name = parent_path = ""
             
-            for prefix in self.config.discovery.generate_prefixes:
-                if parent_name and parent_name.startswith(prefix):
-                    class_name = sanitize_name(parent_name)
-                    return f"cocotb.handle.HierarchyArrayObject[{class_name}]"
+            if parent_name and parent_name.startswith(self._generate_prefixes):
+                class_name = sanitize_name(parent_name)
+                return f"cocotb.handle.HierarchyArrayObject[{class_name}]"
             
-            parent_path = getattr(obj, "_path", "")
             if parent_path:
-                path_parts = parent_path.split('.')
-                for part in reversed(path_parts):
-                    for prefix in self.config.discovery.generate_prefixes:
-                        if part.startswith(prefix):
-                            class_name = sanitize_name(part)
-                            return f"cocotb.handle.HierarchyArrayObject[{class_name}]"
+                for part in reversed(parent_path.split('.')):
+                    if part.startswith(self._generate_prefixes):
+                        class_name = sanitize_name(part)
+                        return f"cocotb.handle.HierarchyArrayObject[{class_name}]"
             
-            return f"cocotb.handle.HierarchyArrayObject[cocotb.handle.SimHandleBase]"
+            return self._fallback_genarray_simhandle
             
         except (IndexError, AttributeError, TypeError):
-            return f"cocotb.handle.HierarchyArrayObject[cocotb.handle.SimHandleBase]"
-    
-    def _map_base_class_to_string(self, base_class: type) -> str:
-        """Map base class type to its string representation using intelligent lookup."""
-        return self._base_class_mappings.get(base_class, self.config.types.fallback_types['base'])
+            return self._fallback_genarray_simhandle
     
     def _process_simulator_type(self, sim_type: int, obj: SimHandleBase) -> str:
         """Process different simulator types using intelligent dispatch."""
-        type_handler = self._simulator_type_handlers.get(sim_type)
-        
-        if type_handler == 'NETARRAY':
-            return self._process_netarray_type(obj)
-        elif type_handler == 'LOGIC_ARRAY':
-            return self._process_logic_array_type(obj)
-        elif type_handler == 'LOGIC':
-            return "cocotb.handle.LogicObject"
-        elif type_handler == 'INTEGER':
-            return "cocotb.handle.IntegerObject"
-        elif type_handler == 'REAL':
-            return "cocotb.handle.RealObject"
-        elif type_handler == 'ENUM':
-            return "cocotb.handle.EnumObject"
-        elif type_handler == 'STRING':
-            return "cocotb.handle.StringObject"
-        elif type_handler == 'GENARRAY':
-            return self._process_genarray_type(obj)
+        handler = self._simulator_type_handlers.get(sim_type)
+        if handler is not None:
+            return handler(obj)
         
-        base_class = self._type_mappings.get(sim_type)
-        if base_class:
-            return self._map_base_class_to_string(base_class)
-        
-        return self.config.types.fallback_types['base']
+        return self._type_name_strings.get(sim_type, self._fallback_base)
     
     def extract_full_type_info(self, obj: SimHandleBase) -> str:
         """Extract comprehensive type information with proper generic parameters."""
         handle, sim_type = self._get_object_info(obj)
         if handle is None:
-            return self.config.types.fallback_types['base']
+            return self._fallback_base
+        
+        return self._extract_sim_type_info(sim_type, obj)
+    
+    def _extract_sim_type_info(self, sim_type: int, obj: SimHandleBase) -> str:
+        """Extract type information for an object whose simulator type is already known."""
+        type_string = self._fixed_type_strings.get(sim_type)
+        if type_string is not None:
+            return type_string
         
-        if sim_type not in self._type_mappings:
-            return f"{self.config.types.fallback_types['base']}"
+        # Only array types depend on the object itself; unmapped types get the base fallback
+        if sim_type in self._special_types:
+            return self._process_simulator_type(sim_type, obj)
+        return self._fallback_base
+    
+    def extract_types_bulk(self, objs: Iterable[SimHandleBase]) -> List[str]:
+        """Extract type information for many objects in a single pass."""
+        # Bind the lookups once so the per-object work is a local dict lookup
+        fixed_type_strings = self._fixed_type_strings
+        extract_sim_type_info = self._extract_sim_type_info
+        extract = self.extract_full_type_info
+        
+        types: List[str] = []
+        append = types.append
+        for obj in objs:
+            try:
+                sim_type = obj._handle.get_type()
+            except AttributeError:
+                append(extract(obj))
+                continue
         
-        return self._process_simulator_type(sim_type, obj)
+            type_string = fixed_type_strings.get(sim_type)
+            if type_string is None:
+                type_string = extract_sim_type_info(sim_type, obj)
+            append(type_string)
+        return types
     
     def extract_hierarchy_element_type(self, obj: SimHandleBase) -> Optional[str]:
         """Extract the element type for HierarchyArrayObject generic parameter."""
@@ -313,12 +363,34 @@ class TypeIntrospector:
             pass
         return None
 
+_INTROSPECTOR: Optional[TypeIntrospector] = None
+
+def _get_introspector() -> TypeIntrospector:
+    """Get the shared introspector, building its lookup tables on first use."""
+    global _INTROSPECTOR
+    if _INTROSPECTOR is None:
+        _INTROSPECTOR = TypeIntrospector()
+    return _INTROSPECTOR
+
 def extract_full_type_info(obj: SimHandleBase) -> str:
     """Extract comprehensive type information with proper generic parameters."""
-    introspector = TypeIntrospector()
-    return introspector.extract_full_type_info(obj)
+    # Skip the accessor call once the shared introspector exists
+    introspector = _INTROSPECTOR if _INTROSPECTOR is not None else _get_introspector()
+    try:
+        sim_type = obj._handle.get_type()
+    except AttributeError:
+        return introspector.extract_full_type_info(obj)
+    
+    # Most signals are plain scalars, so answer those before any further dispatch
+    type_string = introspector._fixed_type_strings.get(sim_type)
+    if type_string is not None:
+        return type_string
+    return introspector._extract_sim_type_info(sim_type, obj)
+
+def extract_types_bulk(objs: Iterable[SimHandleBase]) -> List[str]:
+    """Extract type information for many objects in a single pass."""
+    return _get_introspector().extract_types_bulk(objs)
 
 def extract_hierarchy_element_type(obj: SimHandleBase) -> Optional[str]:
     """Extract the element type for HierarchyArrayObject generic parameter."""
-    introspector = TypeIntrospector()
-    return introspector.extract_hierarchy_element_type(obj)
+    return _get_introspector().extract_hierarchy_element_type(obj)
@@ -0,0 +1,36 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test configuration loading."""
+
+import pytest
+
+from copra.config import get_config
+
+
+def test_config_is_loaded_once_per_environment(monkeypatch: pytest.MonkeyPatch):
+    """Test that repeated lookups share one configuration until the environment changes."""
+    monkeypatch.delenv("COPRA_STUB_FILENAME", raising=False)
+    first = get_config()
+    assert get_config() is first
+
+    monkeypatch.setenv("COPRA_STUB_FILENAME", "other_stubs.pyi")
+    changed = get_config()
+    assert changed is not first
+    assert changed.output.stub_filename == "other_stubs.pyi"
+
+
+def test_config_cache_tracks_every_environment_variable(monkeypatch: pytest.MonkeyPatch):
+    """Test that each variable read by from_env is part of the cache key."""
+    monkeypatch.setenv("COPRA_STUB_DIR", "first_dir")
+    monkeypatch.setenv("COPRA_MAX_DEPTH", "7")
+    first = get_config()
+    assert first.output.default_stub_dir == "first_dir"
+    assert first.discovery.max_depth == 7
+
+    monkeypatch.setenv("COPRA_MAX_DEPTH", "3")
+    assert get_config().discovery.max_depth == 3
+
+    monkeypatch.setenv("COPRA_STUB_DIR", "second_dir")
+    assert get_config().output.default_stub_dir == "second_dir"
@@ -0,0 +1,80 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test hierarchy tree building."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from copra.discovery import HDLNode, HierarchyDict
+
+PATHS = [
+    "dut",
+    "dut.clk",
+    "dut.u_core",
+    "dut.u_core.alu",
+    "dut.u_core.alu.result",
+    "dut.gen_blk",
+    "dut.gen_blk[0]",
+    "dut.gen_blk[0].data",
+    "dut.gen_blk[1]",
+    "dut.gen_blk[1].data",
+]
+
+
+def make_node(path: str) -> HDLNode:
+    """Build a scope node for a hierarchy path."""
+    return HDLNode(path=path, py_type="cocotb.handle.HierarchyObject", width=None, is_scope=True)
+
+
+def split_and_walk_tree(nodes: List[HDLNode]) -> Dict[str, Any]:
+    """Build a tree the way HierarchyDict did before it kept a path index."""
+    tree: Dict[str, Any] = {}
+    for node in nodes:
+        path_parts = node.path.split(".")
+        current = tree
+        for i, part in enumerate(path_parts):
+            if part not in current:
+                current[part] = {"_node": None, "_children": {}}
+            if i == len(path_parts) - 1:
+                current[part]["_node"] = node
+            current = current[part]["_children"]
+    return tree
+
+
+def build_tree(nodes: List[HDLNode]) -> Dict[str, Any]:
+    """Build a tree with HierarchyDict, adding nodes in the given order."""
+    hierarchy = HierarchyDict()
+    for node in nodes:
+        hierarchy._nodes[node.path] = node  # type: ignore[reportPrivateUsage]
+        hierarchy._build_tree_node(node)  # type: ignore[reportPrivateUsage]
+    return hierarchy.get_tree()
+
+
+@pytest.mark.parametrize("paths", [
+    PATHS,
+    list(reversed(PATHS)),
+    [path for path in PATHS if path.count(".") != 1],
+    ["dut.gen_blk[1].data", "dut.u_core.alu.result", "dut.gen_blk[0]", "dut", "dut.u_core"],
+    PATHS + ["dut.u_core", "dut.gen_blk[0]"],
+], ids=["parents_first", "children_first", "missing_parents", "shuffled", "rediscovered"])
+def test_tree_matches_split_and_walk_builder(paths: List[str]):
+    """Test that the indexed tree has the same shape as walking every path from the root."""
+    nodes = [make_node(path) for path in paths]
+
+    assert build_tree(nodes) == split_and_walk_tree(nodes)
+
+
+def test_tree_creates_placeholders_for_missing_parents():
+    """Test that parents discovered after their children fill in the placeholder entry."""
+    leaf = make_node("dut.gen_blk[0].data")
+    scope = make_node("dut.gen_blk[0]")
+
+    tree = build_tree([leaf, scope])
+
+    element = tree["dut"]["_children"]["gen_blk[0]"]
+    assert tree["dut"]["_node"] is None
+    assert element["_node"] is scope
+    assert element["_children"]["data"]["_node"] is leaf
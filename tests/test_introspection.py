@@ -0,0 +1,143 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test type introspection against simulator handle types."""
+
+from typing import Any
+
+import pytest
+from cocotb import simulator
+
+from copra.introspection import TypeIntrospector, extract_full_type_info, extract_types_bulk
+
+
+class MockSimHandle:
+    """Mock simulator handle for testing."""
+
+    def __init__(self, sim_type: int):
+        self._sim_type = sim_type
+
+    def get_type(self) -> int:
+        return self._sim_type
+
+
+class MockObject:
+    """Mock cocotb handle wrapping a simulator handle."""
+
+    def __init__(self, sim_type: int, name: str = "sig", path: str = "dut.sig"):
+        self._handle = MockSimHandle(sim_type)
+        self._name = name
+        self._path = path
+
+
+class MockRange:
+    """Mock cocotb Range exposing only its left bound."""
+
+    def __init__(self, left: int):
+        self.left = left
+
+
+class MockArrayObject(MockObject):
+    """Mock indexable cocotb handle whose elements are all the same child."""
+
+    def __init__(self, sim_type: int, element: Any, name: str = "arr", path: str = "dut.arr"):
+        super().__init__(sim_type, name, path)
+        self.range = MockRange(0)
+        self._element = element
+
+    def __getitem__(self, index: int) -> Any:
+        return self._element
+
+
+def nested_netarray(leaf_sim_type: int, depth: int) -> MockArrayObject:
+    """Build a NETARRAY nested depth times around a single leaf element."""
+    obj: Any = MockObject(leaf_sim_type)
+    for _ in range(depth):
+        obj = MockArrayObject(simulator.NETARRAY, obj)
+    return obj
+
+
+def test_extract_types_bulk_matches_single_extraction():
+    """Test that bulk extraction returns the same types, in order, as per-object extraction."""
+    objs = [
+        MockObject(simulator.LOGIC),
+        MockObject(simulator.INTEGER),
+        MockObject(simulator.LOGIC_ARRAY),
+        MockObject(simulator.MODULE),
+        object(),
+    ]
+
+    types = extract_types_bulk(objs)  # type: ignore
+
+    assert types == [extract_full_type_info(obj) for obj in objs]  # type: ignore
+    assert types == [
+        "cocotb.handle.LogicObject",
+        "cocotb.handle.IntegerObject",
+        "cocotb.handle.LogicArrayObject",
+        "cocotb.handle.HierarchyObject",
+        "cocotb.handle.SimHandleBase",
+    ]
+
+
+@pytest.mark.parametrize("leaf_sim_type,depth,expected", [
+    (simulator.LOGIC, 1,
+     "cocotb.handle.ArrayObject[cocotb.types.Logic, cocotb.handle.LogicObject]"),
+    (simulator.LOGIC_ARRAY, 2,
+     "cocotb.handle.ArrayObject[cocotb.types.Array[cocotb.types.LogicArray], "
+     "cocotb.handle.ArrayObject[cocotb.types.LogicArray, cocotb.handle.LogicArrayObject]]"),
+    (simulator.INTEGER, 3,
+     "cocotb.handle.ArrayObject[cocotb.types.Array[cocotb.types.Array[int]], "
+     "cocotb.handle.ArrayObject[cocotb.types.Array[int], "
+     "cocotb.handle.ArrayObject[int, cocotb.handle.IntegerObject]]]"),
+    (simulator.ENUM, 4,
+     "cocotb.handle.ArrayObject[cocotb.types.Array[cocotb.types.Array[cocotb.types.Array[str]]], "
+     "cocotb.handle.ArrayObject[cocotb.types.Array[cocotb.types.Array[str]], "
+     "cocotb.handle.ArrayObject[cocotb.types.Array[str], "
+     "cocotb.handle.ArrayObject[str, cocotb.handle.EnumObject]]]]"),
+])
+def test_nested_netarray_type_strings(leaf_sim_type: int, depth: int, expected: str):
+    """Test the ArrayObject value and handle type parameters of nested arrays."""
+    assert extract_full_type_info(nested_netarray(leaf_sim_type, depth)) == expected  # type: ignore
+
+
+def test_nested_netarray_element_types():
+    """Test the element value and handle types reported for a two-level array."""
+    introspector = TypeIntrospector()
+    obj = nested_netarray(simulator.REAL, 2)
+
+    assert introspector.get_array_depth(obj) == 2  # type: ignore
+    assert introspector.get_array_element_value_type(obj) == "cocotb.types.Array[float]"  # type: ignore
+    assert introspector.get_array_element_handle_type(obj) == (  # type: ignore
+        "cocotb.handle.ArrayObject[float, cocotb.handle.RealObject]"
+    )
+
+
+def test_netarray_type_cache_is_keyed_on_shape():
+    """Test that arrays of different depth or leaf type never share a cached type string."""
+    introspector = TypeIntrospector()
+    shapes = [
+        (simulator.LOGIC, 2),
+        (simulator.LOGIC, 3),
+        (simulator.INTEGER, 2),
+        (simulator.LOGIC, 2),
+    ]
+
+    types = [introspector.extract_full_type_info(nested_netarray(*shape)) for shape in shapes]  # type: ignore
+
+    assert types[0] == types[3]
+    assert len(set(types)) == 3
+
+
+@pytest.mark.parametrize("name,path,expected", [
+    ("gen_blk", "top.gen_blk", "cocotb.handle.HierarchyArrayObject[GenBlk]"),
+    ("blk", "top.gen_outer.blk", "cocotb.handle.HierarchyArrayObject[GenOuter]"),
+    ("blk", "top.u_core.blk",
+     "cocotb.handle.HierarchyArrayObject[cocotb.handle.SimHandleBase]"),
+])
+def test_genarray_element_class_name(name: str, path: str, expected: str):
+    """Test that generate arrays are named after their own or nearest generate-prefixed scope."""
+    element = MockObject(simulator.MODULE, name=f"{name}[0]", path=f"{path}[0]")
+    obj = MockArrayObject(simulator.GENARRAY, element, name=name, path=path)
+
+    assert extract_full_type_info(obj) == expected  # type: ignore